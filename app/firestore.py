@@ -23,7 +23,8 @@ Also provides helper functions for working with narrative turns subcollection.
 
 import os
 import threading
-from typing import Optional, List
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
 from google.cloud import firestore  # type: ignore[import-untyped]
 
 from app.config import get_settings
@@ -32,6 +33,21 @@ from app.config import get_settings
 _firestore_client: Optional[firestore.Client] = None
 _firestore_lock = threading.Lock()
 
+# Firestore limit on operations per batched write
+_MAX_BATCH_WRITES = 500
+
+# Short-lived cache of narrative turn counts: character_id -> (expires_at, count).
+# Writes through the helpers below invalidate their character's entry; the TTL
+# bounds staleness for writes made elsewhere.
+_NARRATIVE_TURN_COUNT_TTL_SECONDS = 5.0
+_NARRATIVE_TURN_COUNT_CACHE_SIZE = 1024
+_narrative_turn_count_cache: Dict[str, Tuple[float, int]] = {}
+# Bumped on every invalidation so a count read before a write is never stored after
+# it. A single counter stays bounded; a write to any character only skips caching
+# counts that were in flight at the time.
+_narrative_turn_count_generation = 0
+_narrative_turn_count_lock = threading.Lock()
+
 
 def get_firestore_client() -> firestore.Client:
     """
@@ -104,6 +120,24 @@ def reset_firestore_client() -> None:
         _firestore_client = None
 
 
+def clear_narrative_turn_count_cache() -> None:
+    """
+    Drop all cached narrative turn counts.
+
+    Primarily used by tests so each test starts without cached counts.
+    """
+    with _narrative_turn_count_lock:
+        _narrative_turn_count_cache.clear()
+
+
+def _invalidate_narrative_turn_count(character_id: str) -> None:
+    """Forget the cached narrative turn count for one character."""
+    global _narrative_turn_count_generation
+    with _narrative_turn_count_lock:
+        _narrative_turn_count_cache.pop(character_id, None)
+        _narrative_turn_count_generation += 1
+
+
 # ==============================================================================
 # Narrative Turns Subcollection Helpers
 # ==============================================================================
@@ -176,24 +210,88 @@ def write_narrative_turn(
     collection = get_narrative_turns_collection(character_id)
     doc_ref = collection.document(turn_id)
     doc_ref.set(turn_data)
+    _invalidate_narrative_turn_count(character_id)
 
     return doc_ref
 
 
+def write_narrative_turns_batch(
+    character_id: str, turns: List[dict], *, use_server_timestamp: bool = True
+) -> List[firestore.DocumentReference]:
+    """
+    Write several narrative turns using batched writes.
+
+    Turns are committed in batches of up to 500 writes (the Firestore limit), so
+    bulk imports need one RPC per 500 turns instead of one per turn. Each batch
+    is atomic; batches are committed in order.
+
+    Args:
+        character_id: The UUID of the character
+        turns: Turn dictionaries, each in the shape accepted by write_narrative_turn
+        use_server_timestamp: If True, replace timestamps with SERVER_TIMESTAMP (default: True)
+
+    Returns:
+        DocumentReferences for the written turns, in input order
+
+    Raises:
+        ValueError: If any turn is missing 'turn_id' or 'timestamp' (when
+            use_server_timestamp=False); nothing is written in that case
+
+    Example:
+        >>> turn_data = [narrative_turn_to_firestore(turn) for turn in turns]
+        >>> doc_refs = write_narrative_turns_batch(character_id, turn_data)
+    """
+    # Validate everything up front so a bad turn never leaves a partial import
+    for turn_data in turns:
+        if "turn_id" not in turn_data:
+            raise ValueError("turn_data must include 'turn_id' field")
+        if not use_server_timestamp and "timestamp" not in turn_data:
+            raise ValueError(
+                "turn_data must include 'timestamp' field when use_server_timestamp=False"
+            )
+
+    client = get_firestore_client()
+    collection = get_narrative_turns_collection(character_id)
+    doc_refs = []
+
+    for start in range(0, len(turns), _MAX_BATCH_WRITES):
+        batch = client.batch()
+        for turn_data in turns[start : start + _MAX_BATCH_WRITES]:
+            if use_server_timestamp:
+                turn_data = dict(turn_data)  # Make a copy to avoid mutating input
+                turn_data["timestamp"] = firestore.SERVER_TIMESTAMP
+            doc_ref = collection.document(turn_data["turn_id"])
+            batch.set(doc_ref, turn_data)
+            doc_refs.append(doc_ref)
+        batch.commit()
+        _invalidate_narrative_turn_count(character_id)
+
+    return doc_refs
+
+
 def query_narrative_turns(
     character_id: str,
     *,
     limit: Optional[int] = None,
     order_by: str = "timestamp",
     direction: str = "DESCENDING",
+    cursor_start_after: Optional[firestore.DocumentSnapshot] = None,
 ) -> List[dict]:
     """
     Query narrative turns for a character, ordered by timestamp.
 
     Always returns turns in oldest-to-newest order (chronological reading order),
     regardless of the query direction. When direction="DESCENDING" (default), the
-    function queries newest-first for Firestore index efficiency and then reverses
-    the results. When direction="ASCENDING", results are already in chronological order.
+    most recent turns are selected with an ascending order plus limit_to_last;
+    the client library runs that query descending and reverses the page itself.
+    When direction="ASCENDING", the earliest turns are returned.
+
+    Pagination with cursor_start_after follows the direction:
+    - DESCENDING: returns the up to ``limit`` turns immediately *older* than the
+      cursor (the previous page when paging back through history); pass the
+      oldest turn of the current page as the cursor.
+    - ASCENDING: returns the up to ``limit`` turns immediately *newer* than the
+      cursor; pass the newest turn of the current page as the cursor.
 
     Args:
         character_id: The UUID of the character
@@ -201,6 +299,8 @@ def query_narrative_turns(
         order_by: Field to order by (default: "timestamp")
         direction: Sort direction - "ASCENDING" or "DESCENDING" (default: "DESCENDING")
             Note: Results are always returned oldest-to-newest regardless of this parameter
+        cursor_start_after: Document snapshot to page from (see above for which
+            page is returned in each direction)
 
     Returns:
         List of turn dictionaries in oldest-to-newest order
@@ -220,27 +320,38 @@ def query_narrative_turns(
     if limit > max_limit:
         limit = max_limit
 
-    # Build query
     collection = get_narrative_turns_collection(character_id)
-    query = collection.order_by(
-        order_by,
-        direction=firestore.Query.DESCENDING
-        if direction == "DESCENDING"
-        else firestore.Query.ASCENDING,
-    )
-
-    if limit:
-        query = query.limit(limit)
-
-    # Execute query and convert to list
-    turns = [doc.to_dict() for doc in query.stream()]
-
-    # Always return in oldest-to-newest order (chronological reading order)
-    # If we queried DESCENDING (newest-first), reverse to get oldest-first
-    if direction == "DESCENDING":
-        turns.reverse()
+    docs: Iterable[firestore.DocumentSnapshot]
+
+    if direction == "DESCENDING" and cursor_start_after is not None:
+        # Older page: walk newest-first from the cursor, then restore chronological
+        # order. Cursors are not combined with limit_to_last, because the client's
+        # order flip for limit_to_last does not move the cursors with it.
+        query = collection.order_by(
+            order_by, direction=firestore.Query.DESCENDING
+        ).start_after(cursor_start_after)
+        if limit:
+            query = query.limit(limit)
+        docs = reversed(list(query.stream()))
+    elif direction == "DESCENDING" and limit:
+        # Latest N turns: the client library runs this query descending and
+        # reverses the page before returning it, so it comes back oldest-first.
+        # limit_to_last queries only support get(), not stream().
+        docs = (
+            collection.order_by(order_by, direction=firestore.Query.ASCENDING)
+            .limit_to_last(limit)
+            .get()
+        )
+    else:
+        query = collection.order_by(order_by, direction=firestore.Query.ASCENDING)
+        # Apply cursor for pagination if provided; avoids offset reads of skipped turns
+        if cursor_start_after is not None:
+            query = query.start_after(cursor_start_after)
+        if limit:
+            query = query.limit(limit)
+        docs = query.stream()
 
-    return turns
+    return [doc.to_dict() for doc in docs]
 
 
 def get_narrative_turn_by_id(character_id: str, turn_id: str) -> Optional[dict]:
@@ -272,7 +383,9 @@ def count_narrative_turns(character_id: str) -> int:
     Count the total number of narrative turns for a character.
 
     This function uses Firestore's count() aggregation, which is efficient
-    and incurs the cost of a single document read.
+    and incurs the cost of a single document read. Results are cached per
+    character for a few seconds; writes through write_narrative_turn and
+    write_narrative_turns_batch invalidate the cached value.
 
     Args:
         character_id: The UUID of the character
@@ -284,12 +397,33 @@ def count_narrative_turns(character_id: str) -> int:
         >>> count = count_narrative_turns(character_id)
         >>> print(f"Character has {count} narrative turns")
     """
+    now = time.monotonic()
+    with _narrative_turn_count_lock:
+        cached = _narrative_turn_count_cache.get(character_id)
+        generation = _narrative_turn_count_generation
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
     collection = get_narrative_turns_collection(character_id)
     # Use the efficient count() aggregation query
     count_query = collection.count()
     result = count_query.get()
     # The result is an AggregationResult with a value attribute
-    return result[0][0].value
+    count = result[0][0].value
+
+    with _narrative_turn_count_lock:
+        if _narrative_turn_count_generation != generation:
+            # A write happened while counting; the count may predate it
+            return count
+        _narrative_turn_count_cache.pop(character_id, None)
+        if len(_narrative_turn_count_cache) >= _NARRATIVE_TURN_COUNT_CACHE_SIZE:
+            # Evict the oldest entry (dicts preserve insertion order)
+            _narrative_turn_count_cache.pop(next(iter(_narrative_turn_count_cache)))
+        _narrative_turn_count_cache[character_id] = (
+            now + _NARRATIVE_TURN_COUNT_TTL_SECONDS,
+            count,
+        )
+    return count
 
 
 # ==============================================================================
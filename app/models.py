@@ -26,10 +26,10 @@ The models support:
 
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Any, Literal, Optional, Union
+from typing import Annotated, Any, Literal, Optional, Union
 
 from google.cloud import firestore  # type: ignore[import-untyped]
-from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Discriminator, Field, Tag, model_validator
 
 from app.logging import get_logger
 
@@ -53,6 +53,21 @@ class Status(str, Enum):
 CombatStatus = Status
 
 
+def _effect_kind(value: Any) -> str:
+    """Tag an effect value as free text or a structured dict."""
+    # bytes/bytearray stay on the text branch, which coerces them to str as before
+    return "text" if isinstance(value, (str, bytes, bytearray)) else "structured"
+
+
+# Item/weapon effects are either a text description or a structured dict.
+# The callable discriminator selects the branch up front, so validation does
+# not try each union member in turn (and errors name only the chosen branch).
+Effect = Annotated[
+    Union[Annotated[str, Tag("text")], Annotated[dict[str, Any], Tag("structured")]],
+    Discriminator(_effect_kind),
+]
+
+
 class Location(BaseModel):
     """
     Location information with ID and display name.
@@ -139,7 +154,7 @@ class Weapon(BaseModel):
 
     name: str = Field(description="Weapon name")
     damage: Union[int, str] = Field(description="Weapon damage (e.g., '1d8' or 8)")
-    special_effects: Optional[Union[str, dict[str, Any]]] = Field(
+    special_effects: Optional[Effect] = Field(
         default=None, description="Special weapon effects as string or structured dict"
     )
 
@@ -158,7 +173,7 @@ class InventoryItem(BaseModel):
 
     name: str = Field(description="Item name")
     quantity: int = Field(default=1, description="Number of items")
-    effect: Optional[Union[str, dict[str, Any]]] = Field(
+    effect: Optional[Effect] = Field(
         default=None, description="Item effect as string or structured dict"
     )
 
@@ -264,6 +279,8 @@ class NarrativeTurn(BaseModel):
         serialization_alias="gm_response",
         description="Game master's/AI's response (max 32000 characters)",
     )
+    # ISO 8601 strings (e.g. from JSON request bodies) are parsed by pydantic-core
+    # directly; callers holding a string need not convert it to datetime first.
     timestamp: datetime = Field(
         description="When the turn occurred (datetime object or ISO 8601 string)"
     )
@@ -18,76 +18,94 @@ Tests validation of field size limits, configuration settings,
 and Firestore helper functions for narrative turns subcollection.
 """
 
+import contextlib
 from datetime import datetime, timezone
+import itertools
 import uuid
 import pytest
 from pydantic import ValidationError
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 from app.models import NarrativeTurn, narrative_turn_to_firestore
 from app.config import Settings
 
+_USER_ACTION_AT_LIMIT = "A" * 8000
+_USER_ACTION_OVER = _USER_ACTION_AT_LIMIT + "A"
+_AI_RESPONSE_AT_LIMIT = "B" * 32000
+_AI_RESPONSE_OVER = _AI_RESPONSE_AT_LIMIT + "B"
+
+_NOW = datetime(2025, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+
+_UUID_POOL = tuple(str(uuid.uuid4()) for _ in range(64))
+_next_uuid = itertools.cycle(_UUID_POOL).__next__
+
+
+def _make_query_mocks(collection, docs=()):
+    """
+    Wire both query_narrative_turns read paths and return the ordered query mock.
+
+    order_by(...).limit_to_last(...).get() serves the default latest-turns path and
+    order_by(...).limit(...).stream() the ascending path; both yield ``docs``.
+    """
+    query = collection.order_by.return_value
+    query.configure_mock(
+        **{
+            "limit_to_last.return_value.get.return_value": list(docs),
+            "limit.return_value.stream.return_value": list(docs),
+        }
+    )
+    return query
+
+
+@pytest.fixture(scope="module")
+def default_settings():
+    """Settings built once from code defaults and the environment, not .env."""
+    return Settings(_env_file=None)
+
 
 class TestNarrativeTurnFieldValidation:
     """Test field size validation for NarrativeTurn model."""
 
-    def test_user_action_within_limit(self):
-        """Test that user_action within 8000 characters is valid."""
-        user_action = "A" * 8000  # Exactly at limit
-        turn = NarrativeTurn(
-            turn_id=str(uuid.uuid4()),
-            user_action=user_action,
-            ai_response="Response",
-            timestamp=datetime.now(timezone.utc),
-        )
-        assert len(turn.user_action) == 8000
-
-    def test_user_action_exceeds_limit(self):
-        """Test that user_action exceeding 8000 characters raises ValidationError."""
-        user_action = "A" * 8001  # One character over limit
-        with pytest.raises(ValidationError) as exc_info:
-            NarrativeTurn(
-                turn_id=str(uuid.uuid4()),
-                user_action=user_action,
-                ai_response="Response",
-                timestamp=datetime.now(timezone.utc),
-            )
-        assert "user_action" in str(exc_info.value)
-        assert "8000" in str(exc_info.value)
+    @pytest.mark.parametrize(
+        "field, value, error_type",
+        [
+            ("user_action", _USER_ACTION_AT_LIMIT, None),
+            ("user_action", _USER_ACTION_OVER, "string_too_long"),
+            ("user_action", "", "string_too_short"),
+            ("ai_response", _AI_RESPONSE_AT_LIMIT, None),
+            ("ai_response", _AI_RESPONSE_OVER, "string_too_long"),
+            ("ai_response", "", "string_too_short"),
+        ],
+    )
+    def test_field_length_validation(self, field, value, error_type):
+        """Test user_action (1-8000) and ai_response (1-32000) length limits."""
+        kwargs = {
+            "turn_id": _next_uuid(),
+            "user_action": "Action",
+            "ai_response": "Response",
+            "timestamp": _NOW,
+        }
+        kwargs[field] = value
 
-    def test_ai_response_within_limit(self):
-        """Test that ai_response within 32000 characters is valid."""
-        ai_response = "B" * 32000  # Exactly at limit
-        turn = NarrativeTurn(
-            turn_id=str(uuid.uuid4()),
-            user_action="Action",
-            ai_response=ai_response,
-            timestamp=datetime.now(timezone.utc),
-        )
-        assert len(turn.ai_response) == 32000
+        if error_type is None:
+            turn = NarrativeTurn(**kwargs)
+            assert len(getattr(turn, field)) == len(value)
+            return
 
-    def test_ai_response_exceeds_limit(self):
-        """Test that ai_response exceeding 32000 characters raises ValidationError."""
-        ai_response = "B" * 32001  # One character over limit
         with pytest.raises(ValidationError) as exc_info:
-            NarrativeTurn(
-                turn_id=str(uuid.uuid4()),
-                user_action="Action",
-                ai_response=ai_response,
-                timestamp=datetime.now(timezone.utc),
-            )
-        assert "ai_response" in str(exc_info.value)
-        assert "32000" in str(exc_info.value)
+            NarrativeTurn(**kwargs)
+        errors = exc_info.value.errors(include_url=False, include_input=False)
+        assert errors[0]["type"] == error_type
+        assert errors[0]["loc"] == (field,)
 
     def test_both_fields_at_limit(self):
         """Test that both fields can be at their limits simultaneously."""
-        user_action = "A" * 8000
-        ai_response = "B" * 32000
         turn = NarrativeTurn(
-            turn_id=str(uuid.uuid4()),
-            user_action=user_action,
-            ai_response=ai_response,
-            timestamp=datetime.now(timezone.utc),
+            turn_id=_next_uuid(),
+            user_action=_USER_ACTION_AT_LIMIT,
+            ai_response=_AI_RESPONSE_AT_LIMIT,
+            timestamp=_NOW,
         )
         assert len(turn.user_action) == 8000
         assert len(turn.ai_response) == 32000
@@ -95,10 +113,10 @@ class TestNarrativeTurnFieldValidation:
     def test_minimal_valid_turn(self):
         """Test creating a minimal valid narrative turn."""
         turn = NarrativeTurn(
-            turn_id=str(uuid.uuid4()),
+            turn_id=_next_uuid(),
             user_action="I explore",
             ai_response="You see a path",
-            timestamp=datetime.now(timezone.utc),
+            timestamp=_NOW,
         )
         assert turn.user_action == "I explore"
         assert turn.ai_response == "You see a path"
@@ -107,11 +125,11 @@ class TestNarrativeTurnFieldValidation:
     def test_turn_with_all_fields(self):
         """Test creating a narrative turn with all optional fields."""
         turn = NarrativeTurn(
-            turn_id=str(uuid.uuid4()),
+            turn_id=_next_uuid(),
             turn_number=5,
             user_action="I attack",
             ai_response="You deal damage",
-            timestamp=datetime.now(timezone.utc),
+            timestamp=_NOW,
             game_state_snapshot={"health": 100, "location": "dungeon"},
             metadata={"llm_model": "gpt-5.1", "tokens_used": 150},
         )
@@ -123,37 +141,31 @@ class TestNarrativeTurnFieldValidation:
 class TestNarrativeTurnConfiguration:
     """Test configuration settings for narrative turns."""
 
-    def test_default_configuration_values(self):
+    def test_default_configuration_values(self, default_settings):
         """Test that default configuration values are correct."""
-        settings = Settings()
-        assert settings.narrative_turns_default_query_size == 10
-        assert settings.narrative_turns_max_query_size == 100
-        assert settings.narrative_turns_max_user_action_length == 8000
-        assert settings.narrative_turns_max_ai_response_length == 32000
-
-    def test_configuration_validation_min_values(self):
-        """Test that configuration validates minimum values."""
-        # Default query size must be >= 1
-        with pytest.raises(ValidationError):
-            Settings(narrative_turns_default_query_size=0)
-
-        # Max query size must be >= 1
+        assert default_settings.narrative_turns_default_query_size == 10
+        assert default_settings.narrative_turns_max_query_size == 100
+        assert default_settings.narrative_turns_max_user_action_length == 8000
+        assert default_settings.narrative_turns_max_ai_response_length == 32000
+
+    @pytest.mark.parametrize(
+        "field, value",
+        [
+            ("narrative_turns_default_query_size", 0),
+            ("narrative_turns_default_query_size", 101),
+            ("narrative_turns_max_query_size", 0),
+            ("narrative_turns_max_query_size", 1001),
+        ],
+    )
+    def test_configuration_validation_bounds(self, field, value):
+        """Test that query sizes outside their configured bounds are rejected."""
         with pytest.raises(ValidationError):
-            Settings(narrative_turns_max_query_size=0)
-
-    def test_configuration_validation_max_values(self):
-        """Test that configuration validates maximum values."""
-        # Default query size must be <= 100
-        with pytest.raises(ValidationError):
-            Settings(narrative_turns_default_query_size=101)
-
-        # Max query size must be <= 1000
-        with pytest.raises(ValidationError):
-            Settings(narrative_turns_max_query_size=1001)
+            Settings(_env_file=None, **{field: value})
 
     def test_custom_configuration_values(self):
         """Test setting custom configuration values."""
         settings = Settings(
+            _env_file=None,
             narrative_turns_default_query_size=20,
             narrative_turns_max_query_size=200,
             narrative_turns_max_user_action_length=10000,
@@ -168,56 +180,64 @@ class TestNarrativeTurnConfiguration:
 class TestNarrativeTurnFirestoreHelpers:
     """Test Firestore helper functions for narrative turns."""
 
-    @patch("app.firestore.get_firestore_client")
-    @patch("app.firestore.get_settings")
-    def test_get_narrative_turns_collection(self, mock_settings, mock_client):
+    @pytest.fixture(autouse=True)
+    def fs_mocks(self):
+        """
+        Patch the Firestore client and settings once per test.
+
+        The real get_narrative_turns_collection runs against the patched client,
+        so the narrative_turns subcollection is the end of the mocked
+        collection/document/collection chain and is exposed as ``collection``.
+        """
+        from app.firestore import clear_narrative_turn_count_cache
+
+        clear_narrative_turn_count_cache()
+        with contextlib.ExitStack() as stack:
+            client = stack.enter_context(patch("app.firestore.get_firestore_client"))
+            settings = stack.enter_context(patch("app.firestore.get_settings"))
+
+            settings_obj = settings.return_value
+            settings_obj.firestore_characters_collection = "characters"
+            settings_obj.narrative_turns_default_query_size = 10
+            settings_obj.narrative_turns_max_query_size = 100
+
+            client_obj = client.return_value
+            character_doc = client_obj.collection.return_value.document.return_value
+            yield SimpleNamespace(
+                client=client_obj,
+                settings=settings_obj,
+                character_doc=character_doc,
+                collection=character_doc.collection.return_value,
+            )
+
+    def test_get_narrative_turns_collection(self, fs_mocks):
         """Test getting narrative turns collection reference."""
         from app.firestore import get_narrative_turns_collection
 
-        # Setup mocks
-        mock_settings_obj = Mock()
-        mock_settings_obj.firestore_characters_collection = "characters"
-        mock_settings.return_value = mock_settings_obj
-
-        mock_client_obj = Mock()
-        mock_collection = Mock()
-        mock_document = Mock()
-        mock_subcollection = Mock()
-
-        mock_client_obj.collection.return_value = mock_collection
-        mock_collection.document.return_value = mock_document
-        mock_document.collection.return_value = mock_subcollection
-        mock_client.return_value = mock_client_obj
-
-        # Test
-        character_id = str(uuid.uuid4())
+        character_id = _next_uuid()
         result = get_narrative_turns_collection(character_id)
 
-        # Verify
-        mock_client_obj.collection.assert_called_once_with("characters")
-        mock_collection.document.assert_called_once_with(character_id)
-        mock_document.collection.assert_called_once_with("narrative_turns")
-        assert result == mock_subcollection
+        fs_mocks.client.collection.assert_called_once_with("characters")
+        fs_mocks.client.collection.return_value.document.assert_called_once_with(
+            character_id
+        )
+        fs_mocks.character_doc.collection.assert_called_once_with("narrative_turns")
+        assert result == fs_mocks.collection
 
-    @patch("app.firestore.get_narrative_turns_collection")
-    def test_write_narrative_turn(self, mock_get_collection):
+    def test_write_narrative_turn(self, fs_mocks):
         """Test writing a narrative turn."""
         from app.firestore import write_narrative_turn
 
-        # Setup mocks
-        mock_collection = Mock()
-        mock_doc_ref = Mock()
-        mock_collection.document.return_value = mock_doc_ref
-        mock_get_collection.return_value = mock_collection
+        mock_doc_ref = fs_mocks.collection.document.return_value
 
         # Test data
-        character_id = str(uuid.uuid4())
-        turn_id = str(uuid.uuid4())
+        character_id = _next_uuid()
+        turn_id = _next_uuid()
         turn_data = {
             "turn_id": turn_id,
             "player_action": "I explore",
             "gm_response": "You see a path",
-            "timestamp": datetime.now(timezone.utc),
+            "timestamp": _NOW,
         }
 
         # Test
@@ -226,32 +246,30 @@ class TestNarrativeTurnFirestoreHelpers:
         )
 
         # Verify
-        mock_get_collection.assert_called_once_with(character_id)
-        mock_collection.document.assert_called_once_with(turn_id)
+        fs_mocks.client.collection.return_value.document.assert_called_once_with(
+            character_id
+        )
+        fs_mocks.collection.document.assert_called_once_with(turn_id)
         mock_doc_ref.set.assert_called_once()
         assert result == mock_doc_ref
 
-    @patch("app.firestore.get_narrative_turns_collection")
-    def test_write_narrative_turn_missing_turn_id(self, mock_get_collection):
+    def test_write_narrative_turn_missing_turn_id(self):
         """Test that writing a turn without turn_id raises ValueError."""
         from app.firestore import write_narrative_turn
 
-        character_id = str(uuid.uuid4())
+        character_id = _next_uuid()
         turn_data = {"player_action": "I explore", "gm_response": "You see a path"}
 
         with pytest.raises(ValueError) as exc_info:
             write_narrative_turn(character_id, turn_data)
         assert "turn_id" in str(exc_info.value)
 
-    @patch("app.firestore.get_narrative_turns_collection")
-    def test_write_narrative_turn_missing_timestamp_no_server_timestamp(
-        self, mock_get_collection
-    ):
+    def test_write_narrative_turn_missing_timestamp_no_server_timestamp(self):
         """Test that writing a turn without timestamp when use_server_timestamp=False raises ValueError."""
         from app.firestore import write_narrative_turn
 
-        character_id = str(uuid.uuid4())
-        turn_id = str(uuid.uuid4())
+        character_id = _next_uuid()
+        turn_id = _next_uuid()
         turn_data = {
             "turn_id": turn_id,
             "player_action": "I explore",
@@ -263,129 +281,166 @@ class TestNarrativeTurnFirestoreHelpers:
             write_narrative_turn(character_id, turn_data, use_server_timestamp=False)
         assert "timestamp" in str(exc_info.value)
 
-    @patch("app.firestore.get_narrative_turns_collection")
-    @patch("app.firestore.get_settings")
-    def test_query_narrative_turns_default_limit(
-        self, mock_settings, mock_get_collection
-    ):
-        """Test querying narrative turns with default limit."""
-        from app.firestore import query_narrative_turns
+    def test_write_narrative_turns_batch_chunks_at_500(self, fs_mocks):
+        """Test that batched writes commit at most 500 turns per batch."""
+        from app.firestore import write_narrative_turns_batch
+
+        first_batch, second_batch = Mock(), Mock()
+        fs_mocks.client.batch.side_effect = [first_batch, second_batch]
+        turns = [
+            {"turn_id": f"turn_{i}", "player_action": "Act", "gm_response": "Resp"}
+            for i in range(501)
+        ]
 
-        # Setup mocks
-        mock_settings_obj = Mock()
-        mock_settings_obj.narrative_turns_default_query_size = 10
-        mock_settings_obj.narrative_turns_max_query_size = 100
-        mock_settings.return_value = mock_settings_obj
+        result = write_narrative_turns_batch(_next_uuid(), turns)
 
-        mock_collection = Mock()
-        mock_query = Mock()
-        mock_collection.order_by.return_value = mock_query
-        mock_query.limit.return_value = mock_query
+        assert fs_mocks.client.batch.call_count == 2
+        assert first_batch.set.call_count == 500
+        assert second_batch.set.call_count == 1
+        first_batch.commit.assert_called_once()
+        second_batch.commit.assert_called_once()
+        assert len(result) == 501
+        # Server timestamps are applied to copies, not the caller's dicts
+        assert "timestamp" not in turns[0]
 
-        # Create mock documents with distinct dictionaries using side_effect
+    def test_write_narrative_turns_batch_missing_turn_id(self, fs_mocks):
+        """Test that a turn without turn_id fails before anything is committed."""
+        from app.firestore import write_narrative_turns_batch
+
+        turns = [{"turn_id": "turn_1"}, {"player_action": "I explore"}]
+
+        with pytest.raises(ValueError, match="turn_id"):
+            write_narrative_turns_batch(_next_uuid(), turns)
+        fs_mocks.client.batch.assert_not_called()
+
+    def test_query_narrative_turns_default_limit(self, fs_mocks):
+        """Test querying the latest narrative turns with the default limit."""
+        from app.firestore import firestore, query_narrative_turns
+
+        mock_collection = fs_mocks.collection
+
+        # limit_to_last returns the latest turns already in oldest-first order
         mock_doc1 = Mock()
-        mock_doc1.to_dict.return_value = {"turn_number": 3, "player_action": "Action 3"}
+        mock_doc1.to_dict.return_value = {"turn_number": 1, "player_action": "Action 1"}
         mock_doc2 = Mock()
         mock_doc2.to_dict.return_value = {"turn_number": 2, "player_action": "Action 2"}
         mock_doc3 = Mock()
-        mock_doc3.to_dict.return_value = {"turn_number": 1, "player_action": "Action 1"}
-
-        mock_query.stream.return_value = [mock_doc1, mock_doc2, mock_doc3]
+        mock_doc3.to_dict.return_value = {"turn_number": 3, "player_action": "Action 3"}
 
-        mock_get_collection.return_value = mock_collection
+        mock_query = _make_query_mocks(
+            mock_collection, [mock_doc1, mock_doc2, mock_doc3]
+        )
 
         # Test
-        character_id = str(uuid.uuid4())
+        character_id = _next_uuid()
         result = query_narrative_turns(character_id)
 
         # Verify
-        mock_collection.order_by.assert_called_once()
-        mock_query.limit.assert_called_once_with(10)
-
-        # Results should be reversed to oldest-first
-        assert len(result) == 3
-        assert result[0]["turn_number"] == 1
-        assert result[1]["turn_number"] == 2
-        assert result[2]["turn_number"] == 3
-
-    @patch("app.firestore.get_narrative_turns_collection")
-    @patch("app.firestore.get_settings")
-    def test_query_narrative_turns_custom_limit(
-        self, mock_settings, mock_get_collection
-    ):
-        """Test querying narrative turns with custom limit."""
+        mock_collection.order_by.assert_called_once_with(
+            "timestamp", direction=firestore.Query.ASCENDING
+        )
+        mock_query.limit_to_last.assert_called_once_with(10)
+        mock_query.limit.assert_not_called()
+
+        # Results are returned oldest-first as received
+        assert [turn["turn_number"] for turn in result] == [1, 2, 3]
+
+    def test_query_narrative_turns_ascending_direction(self, fs_mocks):
+        """Test that ASCENDING direction returns the earliest turns via limit()."""
         from app.firestore import query_narrative_turns
 
-        # Setup mocks
-        mock_settings_obj = Mock()
-        mock_settings_obj.narrative_turns_default_query_size = 10
-        mock_settings_obj.narrative_turns_max_query_size = 100
-        mock_settings.return_value = mock_settings_obj
+        mock_doc = Mock()
+        mock_doc.to_dict.return_value = {"turn_number": 1}
+        mock_query = _make_query_mocks(fs_mocks.collection, [mock_doc])
+
+        result = query_narrative_turns(_next_uuid(), limit=5, direction="ASCENDING")
 
-        mock_collection = Mock()
-        mock_query = Mock()
-        mock_collection.order_by.return_value = mock_query
-        mock_query.limit.return_value = mock_query
-        mock_query.stream.return_value = []
+        mock_query.limit.assert_called_once_with(5)
+        mock_query.limit_to_last.assert_not_called()
+        assert result == [{"turn_number": 1}]
 
-        mock_get_collection.return_value = mock_collection
+    def test_query_narrative_turns_with_cursor(self, fs_mocks):
+        """Test that a cursor is applied with start_after before the limit."""
+        from app.firestore import query_narrative_turns
+
+        mock_query = _make_query_mocks(fs_mocks.collection)
+        cursor_query = mock_query.start_after.return_value
+        cursor_query.limit.return_value.stream.return_value = []
+        cursor = Mock()
+
+        result = query_narrative_turns(
+            _next_uuid(), limit=5, direction="ASCENDING", cursor_start_after=cursor
+        )
+
+        mock_query.start_after.assert_called_once_with(cursor)
+        cursor_query.limit.assert_called_once_with(5)
+        mock_query.limit.assert_not_called()
+        assert result == []
+
+    def test_query_narrative_turns_descending_cursor_returns_older_page(self, fs_mocks):
+        """Test that a DESCENDING cursor returns the older page, oldest-first."""
+        from app.firestore import firestore, query_narrative_turns
+
+        mock_query = _make_query_mocks(fs_mocks.collection)
+        cursor_query = mock_query.start_after.return_value
+        # Newest-first from the cursor, as the descending query streams them
+        mock_doc3 = Mock()
+        mock_doc3.to_dict.return_value = {"turn_number": 3}
+        mock_doc2 = Mock()
+        mock_doc2.to_dict.return_value = {"turn_number": 2}
+        cursor_query.limit.return_value.stream.return_value = [mock_doc3, mock_doc2]
+        cursor = Mock()
+
+        result = query_narrative_turns(_next_uuid(), limit=2, cursor_start_after=cursor)
+
+        fs_mocks.collection.order_by.assert_called_once_with(
+            "timestamp", direction=firestore.Query.DESCENDING
+        )
+        mock_query.start_after.assert_called_once_with(cursor)
+        cursor_query.limit.assert_called_once_with(2)
+        mock_query.limit_to_last.assert_not_called()
+        assert [turn["turn_number"] for turn in result] == [2, 3]
+
+    def test_query_narrative_turns_custom_limit(self, fs_mocks):
+        """Test querying narrative turns with custom limit."""
+        from app.firestore import query_narrative_turns
+
+        mock_query = _make_query_mocks(fs_mocks.collection)
 
         # Test with custom limit
-        character_id = str(uuid.uuid4())
+        character_id = _next_uuid()
         query_narrative_turns(character_id, limit=25)
 
         # Verify custom limit was used
-        mock_query.limit.assert_called_once_with(25)
+        mock_query.limit_to_last.assert_called_once_with(25)
 
-    @patch("app.firestore.get_narrative_turns_collection")
-    @patch("app.firestore.get_settings")
-    def test_query_narrative_turns_enforces_max_limit(
-        self, mock_settings, mock_get_collection
-    ):
+    def test_query_narrative_turns_enforces_max_limit(self, fs_mocks):
         """Test that query enforces max limit from configuration."""
         from app.firestore import query_narrative_turns
 
-        # Setup mocks
-        mock_settings_obj = Mock()
-        mock_settings_obj.narrative_turns_default_query_size = 10
-        mock_settings_obj.narrative_turns_max_query_size = 100
-        mock_settings.return_value = mock_settings_obj
-
-        mock_collection = Mock()
-        mock_query = Mock()
-        mock_collection.order_by.return_value = mock_query
-        mock_query.limit.return_value = mock_query
-        mock_query.stream.return_value = []
-
-        mock_get_collection.return_value = mock_collection
+        mock_query = _make_query_mocks(fs_mocks.collection)
 
         # Test with limit exceeding max
-        character_id = str(uuid.uuid4())
+        character_id = _next_uuid()
         query_narrative_turns(character_id, limit=500)
 
         # Verify max limit was enforced
-        mock_query.limit.assert_called_once_with(100)
+        mock_query.limit_to_last.assert_called_once_with(100)
 
-    @patch("app.firestore.get_narrative_turns_collection")
-    def test_get_narrative_turn_by_id_exists(self, mock_get_collection):
+    def test_get_narrative_turn_by_id_exists(self, fs_mocks):
         """Test getting a narrative turn by ID when it exists."""
         from app.firestore import get_narrative_turn_by_id
 
-        # Setup mocks
-        mock_collection = Mock()
-        mock_doc_ref = Mock()
-        mock_doc_snapshot = Mock()
+        mock_collection = fs_mocks.collection
+        mock_doc_snapshot = mock_collection.document.return_value.get.return_value
         mock_doc_snapshot.exists = True
         mock_doc_snapshot.to_dict.return_value = {
             "turn_id": "turn_123",
             "player_action": "I explore",
         }
-        mock_doc_ref.get.return_value = mock_doc_snapshot
-        mock_collection.document.return_value = mock_doc_ref
-        mock_get_collection.return_value = mock_collection
 
         # Test
-        character_id = str(uuid.uuid4())
+        character_id = _next_uuid()
         turn_id = "turn_123"
         result = get_narrative_turn_by_id(character_id, turn_id)
 
@@ -394,37 +449,27 @@ class TestNarrativeTurnFirestoreHelpers:
         assert result["turn_id"] == "turn_123"
         mock_collection.document.assert_called_once_with(turn_id)
 
-    @patch("app.firestore.get_narrative_turns_collection")
-    def test_get_narrative_turn_by_id_not_exists(self, mock_get_collection):
+    def test_get_narrative_turn_by_id_not_exists(self, fs_mocks):
         """Test getting a narrative turn by ID when it doesn't exist."""
         from app.firestore import get_narrative_turn_by_id
 
-        # Setup mocks
-        mock_collection = Mock()
-        mock_doc_ref = Mock()
-        mock_doc_snapshot = Mock()
+        mock_doc_snapshot = fs_mocks.collection.document.return_value.get.return_value
         mock_doc_snapshot.exists = False
-        mock_doc_ref.get.return_value = mock_doc_snapshot
-        mock_collection.document.return_value = mock_doc_ref
-        mock_get_collection.return_value = mock_collection
 
         # Test
-        character_id = str(uuid.uuid4())
+        character_id = _next_uuid()
         turn_id = "nonexistent"
         result = get_narrative_turn_by_id(character_id, turn_id)
 
         # Verify
         assert result is None
 
-    @patch("app.firestore.get_narrative_turns_collection")
-    def test_count_narrative_turns(self, mock_get_collection):
+    def test_count_narrative_turns(self, fs_mocks):
         """Test counting narrative turns using Firestore aggregation."""
         from app.firestore import count_narrative_turns
 
-        # Setup mocks
-        mock_collection = Mock()
-        mock_count_query = Mock()
-        mock_collection.count.return_value = mock_count_query
+        mock_collection = fs_mocks.collection
+        mock_count_query = mock_collection.count.return_value
 
         # Mock the aggregation result structure
         # Firestore returns [[AggregationResult]] where AggregationResult has a value attribute
@@ -432,10 +477,8 @@ class TestNarrativeTurnFirestoreHelpers:
         mock_agg_result.value = 5
         mock_count_query.get.return_value = [[mock_agg_result]]
 
-        mock_get_collection.return_value = mock_collection
-
         # Test
-        character_id = str(uuid.uuid4())
+        character_id = _next_uuid()
         result = count_narrative_turns(character_id)
 
         # Verify
@@ -443,63 +486,97 @@ class TestNarrativeTurnFirestoreHelpers:
         mock_collection.count.assert_called_once()
         mock_count_query.get.assert_called_once()
 
-    @patch("app.firestore.get_narrative_turns_collection")
-    def test_count_narrative_turns_empty(self, mock_get_collection):
+    def test_count_narrative_turns_empty(self, fs_mocks):
         """Test counting narrative turns for character with no turns."""
         from app.firestore import count_narrative_turns
 
-        # Setup mocks
-        mock_collection = Mock()
-        mock_count_query = Mock()
-        mock_collection.count.return_value = mock_count_query
-
         # Mock the aggregation result for empty collection
         mock_agg_result = Mock()
         mock_agg_result.value = 0
-        mock_count_query.get.return_value = [[mock_agg_result]]
-
-        mock_get_collection.return_value = mock_collection
+        fs_mocks.collection.count.return_value.get.return_value = [[mock_agg_result]]
 
         # Test
-        character_id = str(uuid.uuid4())
+        character_id = _next_uuid()
         result = count_narrative_turns(character_id)
 
         # Verify
         assert result == 0
 
+    def test_count_narrative_turns_never_streams(self, fs_mocks):
+        """Test that counting uses the aggregation query, not a full scan."""
+        from app.firestore import count_narrative_turns
 
-class TestNarrativeTurnEdgeCases:
-    """Test edge cases for narrative turns."""
+        mock_agg_result = Mock()
+        mock_agg_result.value = 3
+        fs_mocks.collection.count.return_value.get.return_value = [[mock_agg_result]]
 
-    def test_empty_user_action_invalid(self):
-        """Test that empty user_action is invalid."""
-        with pytest.raises(ValidationError):
-            NarrativeTurn(
-                turn_id=str(uuid.uuid4()),
-                user_action="",
-                ai_response="Response",
-                timestamp=datetime.now(timezone.utc),
-            )
+        assert count_narrative_turns(_next_uuid()) == 3
+        fs_mocks.collection.stream.assert_not_called()
 
-    def test_empty_ai_response_invalid(self):
-        """Test that empty ai_response is invalid."""
-        with pytest.raises(ValidationError):
-            NarrativeTurn(
-                turn_id=str(uuid.uuid4()),
-                user_action="Action",
-                ai_response="",
-                timestamp=datetime.now(timezone.utc),
-            )
+    def test_count_narrative_turns_memoized(self, fs_mocks):
+        """Test that back-to-back counts for one character issue a single query."""
+        from app.firestore import count_narrative_turns
+
+        mock_count_query = fs_mocks.collection.count.return_value
+        mock_agg_result = Mock()
+        mock_agg_result.value = 7
+        mock_count_query.get.return_value = [[mock_agg_result]]
+
+        character_id = _next_uuid()
+        assert count_narrative_turns(character_id) == 7
+        assert count_narrative_turns(character_id) == 7
+        assert mock_count_query.get.call_count == 1
+
+    def test_count_narrative_turns_invalidated_by_write(self, fs_mocks):
+        """Test that writing a turn drops the cached count for that character."""
+        from app.firestore import count_narrative_turns, write_narrative_turn
+
+        mock_count_query = fs_mocks.collection.count.return_value
+        mock_agg_result = Mock()
+        mock_agg_result.value = 1
+        mock_count_query.get.return_value = [[mock_agg_result]]
+
+        character_id = _next_uuid()
+        count_narrative_turns(character_id)
+        write_narrative_turn(character_id, {"turn_id": _next_uuid()})
+        count_narrative_turns(character_id)
+
+        assert mock_count_query.get.call_count == 2
+
+    def test_count_narrative_turns_not_cached_across_concurrent_write(self, fs_mocks):
+        """Test that a count read before a concurrent write is not cached."""
+        from app.firestore import count_narrative_turns, write_narrative_turn
+
+        character_id = _next_uuid()
+        mock_agg_result = Mock()
+        mock_agg_result.value = 1
+
+        def count_then_write():
+            # Simulates a write landing while the aggregation is in flight
+            write_narrative_turn(character_id, {"turn_id": _next_uuid()})
+            return [[mock_agg_result]]
+
+        mock_count_query = fs_mocks.collection.count.return_value
+        mock_count_query.get.side_effect = count_then_write
+
+        count_narrative_turns(character_id)
+        mock_count_query.get.side_effect = None
+        mock_count_query.get.return_value = [[mock_agg_result]]
+        count_narrative_turns(character_id)
+
+        assert mock_count_query.get.call_count == 2
+
+
+class TestNarrativeTurnEdgeCases:
+    """Test edge cases for narrative turns."""
 
     def test_narrative_turn_serialization_preserves_limits(self):
         """Test that serialization preserves field lengths at limits."""
-        user_action = "A" * 8000
-        ai_response = "B" * 32000
         turn = NarrativeTurn(
-            turn_id=str(uuid.uuid4()),
-            user_action=user_action,
-            ai_response=ai_response,
-            timestamp=datetime.now(timezone.utc),
+            turn_id=_next_uuid(),
+            user_action=_USER_ACTION_AT_LIMIT,
+            ai_response=_AI_RESPONSE_AT_LIMIT,
+            timestamp=_NOW,
         )
 
         # Serialize and check
@@ -511,7 +588,7 @@ class TestNarrativeTurnEdgeCases:
         """Test that future timestamps are accepted (as per edge case docs)."""
         future_time = datetime(2099, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
         turn = NarrativeTurn(
-            turn_id=str(uuid.uuid4()),
+            turn_id=_next_uuid(),
             user_action="Action",
             ai_response="Response",
             timestamp=future_time,
@@ -522,7 +599,7 @@ class TestNarrativeTurnEdgeCases:
         """Test that past timestamps are accepted (for backfilling)."""
         past_time = datetime(2000, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
         turn = NarrativeTurn(
-            turn_id=str(uuid.uuid4()),
+            turn_id=_next_uuid(),
             user_action="Action",
             ai_response="Response",
             timestamp=past_time,